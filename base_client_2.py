@@ -148,7 +148,7 @@ class Client(UserClient):
                 target_spot = current.position.add_x(-1)
 
             # Is slot empty
-            target_spot.y = 0
+            target_spot = Vector(target_spot.x, 0)
             if world.get_character_from(target_spot) == None:
                 diff: Vector = self.sub_vectors(target_spot, current.position)
                 if(diff.y > 0):
@@ -0,0 +1,68 @@
+"""
+This file contains the forward model, which lets clients look ahead. ``fork()`` turns the gameboard and team manager a
+client is given into a Battle State, and ``step()`` and ``play()`` run turns of it with the same rules as the engine
+without changing the game. A Battle State only stores lists of ints, so forking it for every line of play is cheap.
+
+Example:
+::
+    from game.commander_clash.forward_model import fork, play, score
+
+    def take_turn(self, turn, actions, world, team_manager):
+        state = fork(world, team_manager, turn)
+        uroda = play(state, [(ActionType.USE_S1, ActionType.USE_NM), (ActionType.USE_NM, ActionType.USE_NM)])
+        ...
+
+Every pair of actions is the Uroda client's action and the Turpis client's action for one turn, and either can be
+None if that client doesn't act.
+
+The opponent's team manager isn't given to clients, so it is rebuilt from the gameboard's ordered teams. The engine's
+gameboard and team managers share their characters, so this gives the same results in almost every turn. The
+opponent's score starts at 0, and its defeated characters are stand-ins that are only counted.
+"""
+
+from typing import Sequence
+
+from game.common.enums import ActionType, CountryType
+from game.common.map.game_board import GameBoard
+from game.common.team_manager import TeamManager
+
+# the Battle State is part of the engine's battle_state module, which isn't included here, so it's named in quotes
+
+
+def fork(world: GameBoard, team_manager: TeamManager, turn: int) -> 'BattleState':
+    """
+    Creates a Battle State from the gameboard and team manager given to a client on the given turn. The state is
+    before that turn runs, so its first step is the turn the client is choosing actions for.
+    """
+    ...
+
+
+def step(state: 'BattleState', actions: Sequence[Sequence[ActionType] | None]) -> 'BattleState':
+    """
+    Returns the state after the next turn without changing the given state. The actions are the Uroda client's
+    actions and the Turpis client's actions, and either can be None if that client didn't act. A state whose game is
+    over is returned as it is.
+    """
+    ...
+
+
+def play(state: 'BattleState', line: Sequence[tuple[ActionType | None, ActionType | None]]) -> 'BattleState':
+    """
+    Returns the state after playing the line of actions, one pair per turn, without changing the given state. The line
+    stops early if the game ends.
+    """
+    ...
+
+
+def score(state: 'BattleState', country: CountryType) -> int:
+    """
+    Returns the score of the given country.
+    """
+    ...
+
+
+def team_health(state: 'BattleState', country: CountryType) -> dict[str, int]:
+    """
+    Returns the name and health of every character on the given country's team that hasn't been defeated.
+    """
+    ...
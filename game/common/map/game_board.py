@@ -111,6 +111,17 @@ class GameBoard(GameObject):
             x       x
             x       x
             x x x x x   y = 6
+
+    -----
+
+    Indexes:
+    --------
+        The characters on the map are indexed by their coordinate and their name, and every object is indexed by its
+        ObjectType. place(), remove(), replace(), and remove_coordinate() update the indexes for the coordinate they
+        change, and assigning game_map rebuilds them, so the game map must only be changed through those methods.
+
+        get_characters(), get_character_from(), get_character_by_name(), get_opponent_across(),
+        get_adjacent_allies(), and get_objects() read the indexes instead of searching the whole map.
     """
 
     def __init__(self, seed: int | None = None, map_size: Vector = Vector(),
@@ -313,14 +324,10 @@ class GameBoard(GameObject):
     def is_occupiable(self, coords: Vector) -> bool:
         ...
 
-    # Returns the Vector and a list of GameObject for whatever objects you are trying to get
-    # CHANGE RETURN TYPE TO BE A DICT NOT A LIST OF TUPLES
     def get_objects(self, look_for: ObjectType) -> list[tuple[Vector, list[GameObject]]]:
         """
-        Zips together the game map's keys and values. A nested for loop then iterates through the zipped lists, and
-        looks for any objects that have the same object type that was passed in. A list of tuples containing the
-        coordinates and the objects found is returned. If the given object type isn't found on the map, then an empty
-        list is returned
+        Returns a list of tuples containing the coordinates and the objects at them that have the given object type.
+        If the given object type isn't found on the map, then an empty list is returned.
         """
         ...
 
@@ -329,7 +336,28 @@ class GameBoard(GameObject):
 
     def get_characters(self, country: CountryType | None = None) -> dict[Vector, Character]:
         """
-        Returns a dictionary of Vector: Character pair.
+        Returns a dictionary of Vector: Character pairs for every character on the map. If a country is given, only
+        the characters from that country are returned.
+        """
+        ...
+
+    def get_character_by_name(self, name: str) -> Character | None:
+        """
+        Returns the character on the map with the given name. If no character has that name, return None.
+        """
+        ...
+
+    def get_opponent_across(self, character: Character) -> Character | None:
+        """
+        Returns the opposing character across from the given character, which is the character hit by a move that
+        targets a single opponent. If no character is across from it, return None.
+        """
+        ...
+
+    def get_adjacent_allies(self, character: Character) -> list[Character]:
+        """
+        Returns the characters above and below the given character, which are the characters affected by a move that
+        targets adjacent allies.
         """
         ...
 
@@ -1,3 +1,31 @@
+ALLOWED_MODULES = ["game.client.user_client",       # modules that clients are specifically allowed to access
+                   "game.common.enums",
+                   "game.common.map.game_board",
+                   "game.common.map.tile",
+                   "game.common.map.wall",
+                   "game.common.map.game_board",
+                   "game.common.team_manager",
+                   "game.commander_clash.character.character",
+                   "game.commander_clash.character.stats",
+                   "game.commander_clash.forward_model",
+                   "game.commander_clash.moves.effects",
+                   "game.commander_clash.moves.moves",
+                   "game.commander_clash.moves.move_logic",
+                   "game.commander_clash.moves.moveset",
+                   "game.commander_clash.moves.move_logic",
+                   "game.utils.vector",
+                   "typing",
+                   "numpy",
+                   "scipy",
+                   "pandas",
+                   "itertools",
+                   "functools",
+                   "random",
+                   "heapq",
+                   "sympy",
+                   "math",
+                   ]
+
 HEALTH_MODIFIER = 6                                                 # The modfier to increase a character's health
 
 STAT_MINIMUM = 1                                                    # The lowest number a stat can reach
@@ -22,12 +22,16 @@ class MasterController(Controller):
             Increments the turn count as the game plays (look at the engine to see how it's controlled more).
 
         Interpret Current Turn Data:
-            This accesses the gameboard in the first turn of the game and generates the game's seed.
+            This accesses the gameboard in the first turn of the game and generates the game's seed. The gameboard is
+            only deserialized once; the Master Controller keeps that live GameBoard object for the rest of the game.
 
         Client Turn Arguments:
             There are lines of code commented out that create Action Objects instead of using the enum. If your project
             needs Actions Objects instead of the enums, comment out the enums and use Objects as necessary.
 
+            Clients are given read-only views of the live gameboard and their team manager instead of copies. Nothing
+            is copied, and anything a client tries to change raises an error instead.
+
         Turn Logic:
             This method executes every movement and interact behavior from every client in the game. This is done by
             using every other type of Controller object that was created in the project that needs to be managed
@@ -35,7 +39,7 @@ class MasterController(Controller):
 
         Create Turn Log:
             This method creates a dictionary that stores the turn, all client objects, and the gameboard's JSON file to
-            be used as the turn log.
+            be used as the turn log. This is the only place the live gameboard is serialized each turn.
 
         Return Final Results:
             This method creates a dictionary that stores a list of the clients' JSON files. This represents the final
@@ -49,6 +53,7 @@ class MasterController(Controller):
         # self.event_times: tuple[int, int] | None = None
         self.turn: int = 1
         self.current_world_data: dict = None
+        self.game_board: GameBoard | None = None
         self.swap_controller: SwapController = SwapController()
         self.select_move_controller: SelectMoveController = SelectMoveController()
         self.move_controller: MoveController = MoveController()
@@ -70,6 +75,14 @@ class MasterController(Controller):
     def client_turn_arguments(self, client: Player, turn):
         ...
 
+    def get_game_board(self) -> GameBoard:
+        """
+        Returns the live GameBoard used by the engine. The first time it's needed, it's deserialized from the current
+        world data (or used as is if the world data already holds a GameBoard), and share_characters() gives it the
+        team managers' characters. Every call after that returns the same object; the world data isn't read again.
+        """
+        ...
+
     # Perform the main logic that happens per turn
     def turn_logic(self, clients: list[Player], turn):
         ...
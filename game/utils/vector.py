@@ -1,9 +1,24 @@
-from game.common.game_object import GameObject
+import uuid
+
 from game.common.enums import ObjectType
 from typing import Self, Tuple
 
+# Vector ids are made from their coordinates in this namespace, so the same coordinates always have the same id
+_ID_NAMESPACE: uuid.UUID = uuid.UUID('d8f7b9f4-58b1-4e4c-9a51-6f2b0a5c3e10')
+
+# the Vector for every coordinate that's interned; see intern_coords()
+_interned: dict[tuple[int, int], 'Vector'] = dict()
+
+
+def intern_coords(size: 'Vector') -> None:
+    """
+    Interns every coordinate in bounds of a board of the given size. ``Vector(x, y)`` returns the same object for
+    interned coordinates instead of creating a new one, so looking them up in the game map finds the key by identity.
+    """
+    ...
 
-class Vector(GameObject):
+
+class Vector:
     """
     `Vector Class Notes:`
 
@@ -25,68 +40,79 @@ class Vector(GameObject):
     -----
 
     Add to Vector method:
-        This method will take a different Vector object and add it to the current Self reference; that is, this method
-        belongs to a Vector object and is not static.
+        This method will take a different Vector object, add its coordinates to this Vector's, and return the result as
+        a new Vector object. Vectors can't be changed, so the Vector the method is called on stays the same.
 
         Example:
             self_vector: (0, 0)
             vector_1: (1, 3)
 
             Result:
-            self_vector: (1, 3)
+            vector_result: (1, 3)
+            self_vector: (0, 0)
 
     -----
 
     Add X and Add Y methods:
-        These methods act similarly to the ``add_vector()`` method, but instead of changing both the x and y, these
-        methods change their respective variables.
+        These methods act similarly to the ``add_to_vector()`` method, but instead of adding to both the x and y, these
+        methods add to their respective variables. They also return a new Vector object.
 
         Add X Example:
             self_vector: (0, 0)
-            vector_1: (1, 3)
+            x: 1
 
             Result:
-            self_vector: (1, 0)
+            vector_result: (1, 0)
 
         Add Y Example:
             self_vector: (0, 0)
-            vector_1: (1, 3)
+            y: 3
 
             Result:
-            self_vector: (0, 3)
+            vector_result: (0, 3)
 
     -----
 
     As Tuple Method:
         This method returns a tuple of the Vector object in the form of (x, y). This is to help with storing it easily
         or accessing it in an immutable structure.
+
+    -----
+
+    Vectors can't be changed once they're created, so they can be shared and used as dictionary keys safely. Their
+    hash is calculated when they're created, and the coordinates of the game board are interned (see
+    ``intern_coords()``), so ``Vector(x, y)`` gives back the board's own Vector for them.
+
+    This is a change from earlier versions, where x and y could be set. Setting either now raises an AttributeError,
+    so clients that changed a Vector need to create a new one instead:
+
+        Before:
+            target_spot.y = 0
+
+        Now:
+            target_spot = Vector(target_spot.x, 0)
+
+    A Vector isn't a GameObject, but its to_json() still has the id, object_type, and state keys so the logs keep the
+    same format. The id is the same for every Vector with the same coordinates.
     """
 
-    def __init__(self, x: int = 0, y: int = 0):
-        super().__init__()
-        self.object_type: ObjectType = ObjectType.VECTOR
-        self.x = x
-        self.y = y
+    __slots__ = ('x', 'y', '__hash', '__id')
 
-    @property
-    def x(self) -> int:
-        return self.__x
+    object_type: ObjectType = ObjectType.VECTOR
+    state: str = 'idle'
 
-    @x.setter
-    def x(self, x: int) -> None:
-        if x is None or not isinstance(x, int):
-            raise ValueError(f"The given x value, {x}, is not an integer.")
-        self.__x = x
+    def __new__(cls, x: int = 0, y: int = 0) -> Self:
+        ...
 
-    @property
-    def y(self) -> int:
-        return self.__y
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f'{self.__class__.__name__} objects can\'t be changed. Create a new Vector instead.')
 
-    @y.setter
-    def y(self, y: int) -> None:
-        if y is None or not isinstance(y, int):
-            raise ValueError(f"The given y value, {y}, is not an integer.")
-        self.__y = y
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{self.__class__.__name__} objects can\'t be changed. Create a new Vector instead.')
+
+    @property
+    def id(self) -> str:
+        ...
 
     @staticmethod
     def from_xy_tuple(xy_tuple: Tuple[int, int]) -> 'Vector':
@@ -113,13 +139,32 @@ class Vector(GameObject):
         ...
 
     def as_tuple(self) -> Tuple[int, int]:
+        """Returns (x: int, y: int)"""
         ...
 
+    def to_json(self) -> dict:
+        ...
+
+    def from_json(self, data) -> Self:
+        ...
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Self:
+        return self
+
+    def __reduce__(self) -> tuple:
+        return Vector, (self.x, self.y)
+
     def __str__(self) -> str:
         return f'({self.x}, {self.y})'
 
+    def __repr__(self) -> str:
+        return f'Vector({self.x}, {self.y})'
+
     def __hash__(self):
-        return hash(self.as_tuple())
+        return self.__hash
 
     def __eq__(self, other) -> bool:
-        return self.as_tuple() == other.as_tuple()
+        return self is other or (isinstance(other, Vector) and self.x == other.x and self.y == other.y)